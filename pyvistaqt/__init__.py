@@ -1,43 +1,78 @@
 """PyVista package for 3D plotting and mesh analysis."""
 
+import functools
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+# ``_version.py`` is written by setuptools_scm at build/install time (see
+# ``use_scm_version`` in ``setup.py``), which avoids the cost of querying
+# ``importlib.metadata`` on every import.
 try:
-    from importlib.metadata import version
+    from ._version import __version__
+except ImportError:  # pragma: no cover # running from a bare source tree
+    __version__ = '0.0.0'
 
-    __version__ = version("pyvistaqt")
-except Exception:  # pragma: no cover # pylint: disable=broad-exception-caught
-    try:
-        from ._version import __version__
-    except ImportError:
-        __version__ = '0.0.0'
+if TYPE_CHECKING:  # pragma: no cover
+    from .plotting import BackgroundPlotter, MultiPlotter, QtInteractor
+    from .window import MainWindow
 
-try:
-    from qtpy import QtCore  # noqa
-except Exception as exc:  # pragma: no cover # pylint: disable=broad-except
-    _exc_msg = exc
+# The plotting classes pull in pyvista, VTK and the Qt widgets, so they
+# are only imported once they are first accessed (PEP 562).
+_LAZY_IMPORTS = {
+    "BackgroundPlotter": ".plotting",
+    "MainWindow": ".window",
+    "MultiPlotter": ".plotting",
+    "QtInteractor": ".plotting",
+}
+# Drop the classes that a previous load of the module may have cached
+for _name in _LAZY_IMPORTS:
+    globals().pop(_name, None)
+del _name
 
-    # pylint: disable=too-few-public-methods
-    class _QtBindingError:
-        def __init__(self, *args, **kwargs):
-            raise RuntimeError(f"No Qt binding was found, got: {_exc_msg}")
 
-    # pylint: disable=too-few-public-methods
-    class BackgroundPlotter(_QtBindingError):
-        """Handle Qt binding error for BackgroundPlotter."""
+@functools.lru_cache(maxsize=None)
+def _qt_binding_stubs() -> Dict[str, Any]:
+    """Probe the Qt binding once and return stubs if it is unusable."""
+    try:
+        # pylint: disable-next=import-outside-toplevel,unused-import
+        from qtpy import QtCore  # noqa
+    except Exception as exc:  # pragma: no cover # pylint: disable=broad-except
+        _exc_msg = exc
 
-    # pylint: disable=too-few-public-methods
-    class MainWindow(_QtBindingError):
-        """Handle Qt binding error for MainWindow."""
+        # pylint: disable=too-few-public-methods
+        class _QtBindingError:
+            def __init__(self, *args, **kwargs):
+                raise RuntimeError(f"No Qt binding was found, got: {_exc_msg}")
 
-    # pylint: disable=too-few-public-methods
-    class MultiPlotter(_QtBindingError):
-        """Handle Qt binding error for MultiPlotter."""
+        return {
+            name: type(
+                name,
+                (_QtBindingError,),
+                {"__doc__": f"Handle Qt binding error for {name}."},
+            )
+            for name in _LAZY_IMPORTS
+        }
+    return {}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the public classes on first access."""
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    stubs = _qt_binding_stubs()
+    if stubs:  # pragma: no cover
+        value = stubs[name]
+    else:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
-    # pylint: disable=too-few-public-methods
-    class QtInteractor(_QtBindingError):
-        """Handle Qt binding error for QtInteractor."""
 
-else:
-    from .plotting import BackgroundPlotter, MainWindow, MultiPlotter, QtInteractor
+def __dir__() -> List[str]:
+    """Return the module attributes, including the lazy ones."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 
 __all__ = [
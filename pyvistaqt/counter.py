@@ -8,6 +8,8 @@ class Counter(QObject):
 
     # pylint: disable=too-few-public-methods
 
+    __slots__ = ("count", "_emit_finished")
+
     signal_finished = Signal()
 
     def __init__(self, count: int) -> None:
@@ -21,10 +23,11 @@ class Counter(QObject):
             )
         else:
             raise ValueError("count is not strictly positive.")
+        self._emit_finished = self.signal_finished.emit
 
     @Slot()
     def decrease(self) -> None:
         """Decrease the count."""
         self.count -= 1
         if self.count <= 0:
-            self.signal_finished.emit()
+            self._emit_finished()
@@ -1,12 +1,13 @@
 """This module contains Qt dialog widgets."""
 
+import functools
 import os
-from typing import Any, List
+import weakref
+from stat import S_ISDIR
+from typing import TYPE_CHECKING, Any, Callable, List, Tuple
 
-import numpy as np  # type: ignore
-import pyvista as pv
 from qtpy import QtCore
-from qtpy.QtCore import Signal
+from qtpy.QtCore import QTimer, Signal, Slot
 from qtpy.QtWidgets import (
     QDialog,
     QDoubleSpinBox,
@@ -14,10 +15,21 @@ from qtpy.QtWidgets import (
     QFormLayout,
     QHBoxLayout,
     QSlider,
+    QWidget,
 )
 
+from .utils import _blocked
 from .window import MainWindow
 
+if TYPE_CHECKING:  # pragma: no cover
+    import pyvista as pv
+
+
+@functools.lru_cache(maxsize=None)
+def _normalize_name_filters(filefilter: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Strip and deduplicate name filters, once per distinct filter list."""
+    return tuple(dict.fromkeys(flt.strip() for flt in filefilter if flt.strip()))
+
 
 class FileDialog(QFileDialog):
     """Generic file query.
@@ -30,6 +42,11 @@ class FileDialog(QFileDialog):
 
     dlg_accepted = Signal(str)
 
+    # directory of the last accepted file, per parent window
+    _last_directories: "weakref.WeakKeyDictionary[QWidget, str]" = (
+        weakref.WeakKeyDictionary()
+    )
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -37,18 +54,31 @@ class FileDialog(QFileDialog):
         filefilter: List[str] = None,
         save_mode: bool = True,
         show: bool = True,
-        callback: np.ndarray = None,
+        callback: Callable = None,
         directory: bool = False,
     ) -> None:
         """Initialize the file dialog."""
         super().__init__(parent)
 
         if filefilter is not None:
-            self.setNameFilters(filefilter)
+            self.setNameFilters(list(_normalize_name_filters(tuple(filefilter))))
 
         self.setOption(QFileDialog.DontUseNativeDialog)
+        # avoid resolving every symlink of the listed directories
+        self.setOption(QFileDialog.DontResolveSymlinks, True)
+        # loading the icon of each listed entry is costly on network mounts
+        self.setOption(QFileDialog.DontUseCustomDirectoryIcons, True)
         self.accepted.connect(self.emit_accepted)
 
+        # reopen where the last file was accepted instead of rescanning
+        # the working directory first
+        last_directory = (
+            None if parent is None else FileDialog._last_directories.get(parent)
+        )
+        if last_directory is not None and os.path.isdir(last_directory):
+            self.setDirectory(last_directory)
+
+        self._directory_mode = directory
         if directory:
             self.FileMode(QFileDialog.Directory)
             self.setOption(QFileDialog.ShowDirsOnly, True)
@@ -62,6 +92,7 @@ class FileDialog(QFileDialog):
         if show:  # pragma: no cover
             self.show()
 
+    @Slot()
     def emit_accepted(self) -> None:
         """Send signal that the file dialog was closed properly.
 
@@ -71,8 +102,18 @@ class FileDialog(QFileDialog):
         """
         if self.result():
             filename = self.selectedFiles()[0]
-            if os.path.isdir(os.path.dirname(filename)):
-                self.dlg_accepted.emit(filename)
+            dirname = os.path.dirname(filename)
+            # the directory the dialog is listing is known to exist
+            if not self._directory_mode and dirname != self.directory().absolutePath():
+                try:
+                    if not S_ISDIR(os.stat(dirname).st_mode):
+                        return
+                except OSError:  # pragma: no cover
+                    return
+            parent = self.parent()
+            if parent is not None:
+                FileDialog._last_directories[parent] = dirname
+            self.dlg_accepted.emit(filename)
 
 
 class DoubleSlider(QSlider):
@@ -83,34 +124,46 @@ class DoubleSlider(QSlider):
 
     """
 
+    __slots__ = (
+        "decimals",
+        "_max_int",
+        "_min_value",
+        "_max_value",
+        "_scale",
+        "_inv_scale",
+    )
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize the double slider."""
         super().__init__(*args, **kwargs)
+        # display hint only, the slider resolution is set by ``_max_int``
         self.decimals = 5
-        self._max_int = 10**self.decimals
+        # a power of two number of steps (slightly finer than 10**5) keeps
+        # the step size exact for power of two value ranges
+        self._max_int = 1 << 17
 
         super().setMinimum(0)
         super().setMaximum(self._max_int)
 
         self._min_value = 0.0
         self._max_value = 20.0
+        self._update_scale()
 
-    @property
-    def _value_range(self) -> float:
-        """Return the value range of the slider."""
-        return self._max_value - self._min_value
+    def _update_scale(self) -> None:
+        """Cache the factors converting between slider steps and values."""
+        value_range = self._max_value - self._min_value
+        self._scale = value_range / self._max_int
+        self._inv_scale = self._max_int / value_range if value_range else 0.0
 
     def value(self) -> float:
         """Return the value of the slider."""
-        return (
-            float(super().value()) / self._max_int * self._value_range + self._min_value
-        )
+        # QSlider is called directly: these run for every slider move and
+        # a super() proxy would be built on each call
+        return QSlider.value(self) * self._scale + self._min_value
 
     def setValue(self, value: float) -> None:  # pylint: disable=invalid-name
         """Set the value of the slider."""
-        super().setValue(
-            int((value - self._min_value) / self._value_range * self._max_int)
-        )
+        QSlider.setValue(self, int((value - self._min_value) * self._inv_scale + 0.5))
 
     def setMinimum(self, value: float) -> None:  # pylint: disable=invalid-name
         """Set the minimum value of the slider."""
@@ -118,6 +171,7 @@ class DoubleSlider(QSlider):
             raise ValueError("Minimum limit cannot be higher than maximum")
 
         self._min_value = value
+        self._update_scale()
         self.setValue(self.value())
 
     def setMaximum(self, value: float) -> None:  # pylint: disable=invalid-name
@@ -126,14 +180,19 @@ class DoubleSlider(QSlider):
             raise ValueError("Minimum limit cannot be higher than maximum")
 
         self._max_value = value
+        self._update_scale()
         self.setValue(self.value())
 
 
 # this is redefined from above because the above object is a dummy object
 # we use dummy objects to allow the module to import when PyQt5 isn't installed
-class RangeGroup(QHBoxLayout):
+class RangeGroup(QWidget):
     """Range group box widget."""
 
+    __slots__ = ("slider", "spinbox", "minimum", "maximum", "_tolerance")
+
+    value_changed = Signal(float)
+
     # pylint: disable=too-many-arguments,useless-return
     def __init__(
         self,
@@ -156,31 +215,39 @@ class RangeGroup(QHBoxLayout):
         self.spinbox = QDoubleSpinBox(
             value=value, minimum=minimum, maximum=maximum, decimals=4
         )
-
-        self.addWidget(self.slider)
-        self.addWidget(self.spinbox)
-
-        # Connect slider to spinbox
+        # only emit valueChanged once the typed value is committed
+        self.spinbox.setKeyboardTracking(False)
+        # values closer than half a spinbox step are considered equal
+        self._tolerance = 0.5 * 10 ** -self.spinbox.decimals()
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.slider)
+        layout.addWidget(self.spinbox)
+
+        # each widget keeps the other in sync with its signals blocked, so a
+        # change only runs one handler before reaching the callback
         self.slider.valueChanged.connect(self.update_spinbox)
         self.spinbox.valueChanged.connect(self.update_value)
-        self.spinbox.valueChanged.connect(callback)
+        self.value_changed.connect(callback)
 
         return None
 
+    @Slot(int)
     def update_spinbox(self, value: float) -> None:  # pylint: disable=unused-argument
         """Set the value of the internal spinbox."""
-        self.spinbox.setValue(self.slider.value())
-
-    def update_value(self, value: float) -> None:  # pylint: disable=unused-argument
+        new_value = self.slider.value()
+        if abs(new_value - self.spinbox.value()) < self._tolerance:
+            return
+        _blocked(self.spinbox, self.spinbox.setValue, new_value)
+        self.value_changed.emit(self.spinbox.value())
+
+    @Slot(float)
+    def update_value(self, value: float) -> None:
         """Update the value of the internal slider."""
-        # if self.spinbox.value() < self.minimum:
-        #     self.spinbox.setValue(self.minimum)
-        # elif self.spinbox.value() > self.maximum:
-        #     self.spinbox.setValue(self.maximum)
-
-        self.slider.blockSignals(True)
-        self.slider.setValue(self.spinbox.value())
-        self.slider.blockSignals(False)
+        if abs(value - self.slider.value()) >= self._tolerance:
+            _blocked(self.slider, self.slider.setValue, value)
+        self.value_changed.emit(value)
 
     @property
     def value(self) -> float:
@@ -201,8 +268,11 @@ class ScaleAxesDialog(QDialog):
     accepted = Signal(float)
     signal_close = Signal()
 
+    # delay in milliseconds before a change of scale is applied
+    SCALE_DELAY = 30
+
     def __init__(
-        self, parent: MainWindow, plotter: pv.Plotter, show: bool = True
+        self, parent: MainWindow, plotter: "pv.Plotter", show: bool = True
     ) -> None:
         """Initialize the scaling dialog."""
         super().__init__(parent)
@@ -212,14 +282,24 @@ class ScaleAxesDialog(QDialog):
         self.plotter = plotter
         self.plotter.app_window.signal_close.connect(self.close)
 
-        self.x_slider_group = RangeGroup(
-            parent, self.update_scale, value=plotter.scale[0]
-        )
-        self.y_slider_group = RangeGroup(
-            parent, self.update_scale, value=plotter.scale[1]
-        )
-        self.z_slider_group = RangeGroup(
-            parent, self.update_scale, value=plotter.scale[2]
+        # coalesce bursts of slider/spinbox changes into a single rescale
+        self._scale_timer = QTimer(self)
+        self._scale_timer.setSingleShot(True)
+        self._scale_timer.setInterval(self.SCALE_DELAY)
+        self._scale_timer.timeout.connect(self._apply_scale)
+        self.plotter.app_window.signal_close.connect(self._scale_timer.stop)
+
+        # initial slider values
+        scale = plotter.scale
+        self.x_slider_group = RangeGroup(parent, self.update_scale, value=scale[0])
+        self.y_slider_group = RangeGroup(parent, self.update_scale, value=scale[1])
+        self.z_slider_group = RangeGroup(parent, self.update_scale, value=scale[2])
+
+        # bound getters so update_scale avoids the RangeGroup.value properties
+        self._scale_getters = (
+            self.x_slider_group.spinbox.value,
+            self.y_slider_group.spinbox.value,
+            self.z_slider_group.spinbox.value,
         )
 
         form_layout = QFormLayout(self)
@@ -232,10 +312,15 @@ class ScaleAxesDialog(QDialog):
         if show:  # pragma: no cover
             self.show()
 
+    @Slot()
     def update_scale(self) -> None:
-        """Update the scale of all actors in the plotter."""
-        self.plotter.set_scale(
-            self.x_slider_group.value,
-            self.y_slider_group.value,
-            self.z_slider_group.value,
-        )
+        """Schedule an update of the scale of all actors in the plotter."""
+        self._scale_timer.start()
+
+    @Slot()
+    def _apply_scale(self) -> None:
+        scale = tuple(getter() for getter in self._scale_getters)
+        # the plotter can be rescaled elsewhere, so compare with its scale now
+        if scale == tuple(self.plotter.scale):
+            return
+        self.plotter.set_scale(*scale)
@@ -1,102 +1,207 @@
 """This module contains the Qt scene editor."""
 
+import itertools
 import weakref
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
 
 from pyvista import Renderer
-from qtpy.QtCore import Qt
+from qtpy.QtCore import QModelIndex, QSignalBlocker, Qt, QTimer, Slot
+from qtpy.QtGui import QStandardItem, QStandardItemModel
 from qtpy.QtWidgets import (
+    QAbstractItemView,
     QCheckBox,
     QDialog,
     QDoubleSpinBox,
     QHBoxLayout,
     QLabel,
     QStackedWidget,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QTreeView,
     QVBoxLayout,
     QWidget,
 )
 from vtkmodules.vtkRenderingCore import vtkActor
 
+from .utils import _blocked
 from .window import MainWindow
 
+# looked up once, the enum attribute goes through the Qt binding
+_USER_ROLE = Qt.ItemDataRole.UserRole
+
+# labels of the pages
+_AXES_LABEL = "Axes"
+_VISIBILITY_LABEL = "Visibility"
+_OPACITY_LABEL = "Opacity"
+
+
+def _dead_ref() -> None:
+    """Stand for a weak reference before a page is bound."""
+    return None
+
+
+class _SceneModel(QStandardItemModel):
+    """Item model which lets the renderer rows expand before they are filled."""
+
+    # pylint: disable=too-few-public-methods
+
+    def hasChildren(  # pylint: disable=invalid-name
+        self, parent: QModelIndex = QModelIndex()
+    ) -> bool:
+        """Return True for the renderer rows, filled once expanded."""
+        if parent.isValid() and not parent.parent().isValid():
+            return True
+        return super().hasChildren(parent)
+
 
 class Editor(QDialog):
     """Basic scene editor."""
 
+    # pylint: disable=too-many-instance-attributes
+
+    # delay in milliseconds before a scheduled update is applied
+    UPDATE_DELAY = 50
+
     def __init__(self, parent: MainWindow, renderers: List[Renderer]) -> None:
         """Initialize the Editor."""
         super().__init__(parent=parent)
         self.renderers = renderers
         del renderers
 
-        self.tree_widget = QTreeWidget()
-        self.tree_widget.setHeaderHidden(True)
+        self.tree_model = _SceneModel(self)
+        self.tree_view = QTreeView()
+        self.tree_view.setHeaderHidden(True)
+        self.tree_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.stacked_widget = QStackedWidget()
         self.layout = QHBoxLayout()
-        self.layout.addWidget(self.tree_widget)
+        self.layout.addWidget(self.tree_view)
         self.layout.addWidget(self.stacked_widget)
 
-        def _selection_callback() -> None:
-            try:
-                items = self.tree_widget.selectedItems()
-            # Already deleted
-            except RuntimeError:  # pragma: no cover
-                return
-            for item in items:
-                widget_idx = item.data(0, Qt.ItemDataRole.UserRole)
-                self.stacked_widget.setCurrentIndex(widget_idx)
-
-        self.tree_widget.itemSelectionChanged.connect(_selection_callback)
-
         self.setLayout(self.layout)
         self.setWindowTitle("Editor")
         self.setModal(True)
 
-        self.update()
+        # the rows of the tree, the actors are keyed by (renderer index,
+        # actor name) and their weak reference tells if the name still
+        # refers to the same actor
+        self._renderer_items: List[QStandardItem] = []
+        # modification time of the prop collection of each renderer when
+        # its actor rows were last updated
+        self._props_mtimes: List[Optional[int]] = []
+        self._actor_items: Dict[Tuple[int, str], Tuple[QStandardItem, weakref.ref]] = {}
+        # each row stores an id under Qt.UserRole which maps to the object it
+        # shows
+        self._row_ids = itertools.count()
+        self._row_targets: Dict[int, weakref.ref] = {}
 
-    def update(self) -> None:
-        """Update the internal widget list."""
-        self.tree_widget.clear()
-        for idx, renderer in enumerate(self.renderers):
-            actors = renderer._actors  # pylint: disable=protected-access
-            widget_idx = self.stacked_widget.addWidget(_get_renderer_widget(renderer))
-            top_item = QTreeWidgetItem(self.tree_widget, [f"Renderer {idx}"])
-            top_item.setData(0, Qt.ItemDataRole.UserRole, widget_idx)
-            self.tree_widget.addTopLevelItem(top_item)
-            for name, actor in actors.items():
-                if actor is not None:
-                    widget_idx = self.stacked_widget.addWidget(_get_actor_widget(actor))
-                    child_item = QTreeWidgetItem(top_item, [name])
-                    child_item.setData(0, Qt.ItemDataRole.UserRole, widget_idx)
-                    top_item.addChild(child_item)
-        self.tree_widget.expandAll()
+        # a single page per kind of row, bound to the object of the current
+        # row, so the number of widgets does not grow with the scene
+        self._renderer_ref = _dead_ref
+        self._actor_ref = _dead_ref
+        self._renderer_page = self._get_renderer_page()
+        self._actor_page = self._get_actor_page()
+        self.stacked_widget.addWidget(self._renderer_page)
+        self.stacked_widget.addWidget(self._actor_page)
 
-    def toggle(self) -> None:
-        """Toggle the editor visibility."""
-        self.update()
-        if self.isVisible():
-            self.hide()
+        # bursts of update() calls are applied once the scene settles
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(self.UPDATE_DELAY)
+        self._update_timer.timeout.connect(self._do_update)
+
+        # populate the model before the view is attached to avoid
+        # repainting the view for every inserted row
+        self._do_update()
+        self.tree_view.setModel(self.tree_model)
+        self.tree_view.expanded.connect(self._expanded)
+        self.tree_view.selectionModel().currentChanged.connect(self._current_changed)
+
+    @Slot(QModelIndex)
+    def _expanded(self, index: QModelIndex) -> None:
+        if index.parent().isValid():  # pragma: no cover
+            return
+        self._update_renderer(index.row())
+
+    @Slot(QModelIndex, QModelIndex)
+    def _current_changed(self, current: QModelIndex, _: QModelIndex) -> None:
+        row_id = current.data(_USER_ROLE)
+        if row_id is None:
+            return
+        target = self._row_targets[row_id]()
+        if target is None:  # pragma: no cover
+            return
+        if current.parent().isValid():
+            self._bind_actor(target)
         else:
-            self.show()
+            self._bind_renderer(target)
+
+    def _new_row(self, text: str, target: Any) -> QStandardItem:
+        row_id = next(self._row_ids)
+        item = QStandardItem(text)
+        item.setData(row_id, _USER_ROLE)
+        self._row_targets[row_id] = weakref.ref(target)
+        return item
+
+    def _get_renderer_page(self) -> QWidget:
+        # pylint: disable=attribute-defined-outside-init
+        widget = QWidget()
+        layout = QVBoxLayout()
+        self._axes = QCheckBox(_AXES_LABEL)
+        self._axes.toggled.connect(self._set_axes)
+        layout.addWidget(self._axes)
+        widget.setLayout(layout)
+        return widget
+
+    def _get_actor_page(self) -> QWidget:
+        # pylint: disable=attribute-defined-outside-init
+        widget = QWidget()
+        layout = QVBoxLayout()
+
+        # visibility
+        self._visibility = QCheckBox(_VISIBILITY_LABEL)
+        self._visibility.toggled.connect(self._set_visibility)
+        layout.addWidget(self._visibility)
+
+        # opacity, hidden for the actors without property
+        self._opacity_row = QWidget()
+        tmp_layout = QHBoxLayout(self._opacity_row)
+        tmp_layout.setContentsMargins(0, 0, 0, 0)
+        self._opacity = QDoubleSpinBox()
+        self._opacity.setRange(0.0, 1.0)
+        self._opacity.setDecimals(3)
+        self._opacity.setSingleStep(0.05)
+        # only re-render once the typed value is committed
+        self._opacity.setKeyboardTracking(False)
+        self._opacity.valueChanged.connect(self._set_opacity)
+        tmp_layout.addWidget(QLabel(_OPACITY_LABEL))
+        tmp_layout.addWidget(self._opacity)
+        layout.addWidget(self._opacity_row)
 
+        widget.setLayout(layout)
+        return widget
 
-def _get_renderer_widget(renderer: Renderer) -> QWidget:
-    widget = QWidget()
-    layout = QVBoxLayout()
-    axes = QCheckBox("Axes")
-    if hasattr(renderer, "axes_widget"):
-        axes.setChecked(renderer.axes_widget.GetEnabled())
-    else:
-        axes.setChecked(False)
+    def _bind_renderer(self, renderer: Renderer) -> None:
+        self._renderer_ref = weakref.ref(renderer)
+        axes_widget = getattr(renderer, "axes_widget", None)
+        _blocked(
+            self._axes,
+            self._axes.setChecked,
+            axes_widget is not None and bool(axes_widget.GetEnabled()),
+        )
+        self.stacked_widget.setCurrentWidget(self._renderer_page)
 
-    renderer_ref = weakref.ref(renderer)
-    del renderer
+    def _bind_actor(self, actor: vtkActor) -> None:
+        self._actor_ref = weakref.ref(actor)
+        _blocked(
+            self._visibility, self._visibility.setChecked, bool(actor.GetVisibility())
+        )
+        prop = actor.GetProperty()
+        self._opacity_row.setVisible(prop is not None)
+        if prop is not None:
+            _blocked(self._opacity, self._opacity.setValue, prop.GetOpacity())
+        self.stacked_widget.setCurrentWidget(self._actor_page)
 
-    # axes
-    def _axes_callback(state: bool) -> None:
-        renderer = renderer_ref()
+    @Slot(bool)
+    def _set_axes(self, state: bool) -> None:
+        renderer = self._renderer_ref()
         if renderer is None or renderer.parent.iren is None:  # pragma: no cover
             return
         if state:
@@ -104,49 +209,123 @@ def _get_renderer_widget(renderer: Renderer) -> QWidget:
         else:
             renderer.hide_axes()
 
-    axes.toggled.connect(_axes_callback)
-    layout.addWidget(axes)
+    @Slot(bool)
+    def _set_visibility(self, visibility: bool) -> None:
+        actor = self._actor_ref()
+        if actor is not None:
+            actor.SetVisibility(visibility)
 
-    widget.setLayout(layout)
-    return widget
+    @Slot(float)
+    def _set_opacity(self, opacity: float) -> None:
+        # the property wrapper may be collected while the actor lives on, so
+        # it is reached through the actor
+        actor = self._actor_ref()
+        if actor is not None:
+            actor.GetProperty().SetOpacity(opacity)
 
+    def update(self) -> None:
+        """Schedule an update of the internal widget list.
 
-def _get_actor_widget(actor: vtkActor) -> QWidget:
-    widget = QWidget()
-    layout = QVBoxLayout()
+        Only the actors added or removed since the last update get their
+        row created or deleted, and only below the expanded renderers. Calls
+        made within ``UPDATE_DELAY`` milliseconds of each other are applied
+        once.
+        """
+        self._update_timer.start()
 
-    prop = actor.GetProperty()
+    def invalidate(self) -> None:
+        """Mark every listed actor as out of date and schedule an update.
 
-    # visibility
-    set_vis_ref = weakref.ref(actor.SetVisibility)
+        Changes that leave the actors of a renderer in place, such as a
+        renamed actor, are not detected by :meth:`update` alone.
+        """
+        self._props_mtimes = [None] * len(self._props_mtimes)
+        self.update()
 
-    def _set_vis(visibility: bool) -> None:  # pragma: no cover
-        set_vis = set_vis_ref()
-        if set_vis is not None:
-            set_vis(visibility)
+    def _is_outdated(self) -> bool:
+        if len(self.renderers) != len(self._renderer_items):
+            return True
+        for idx, renderer in enumerate(self.renderers):
+            if self.tree_view.isExpanded(self._renderer_items[idx].index()):
+                if renderer.GetViewProps().GetMTime() != self._props_mtimes[idx]:
+                    return True
+        return False
 
-    visibility = QCheckBox("Visibility")
-    visibility.setChecked(actor.GetVisibility())
-    visibility.toggled.connect(_set_vis)
-    layout.addWidget(visibility)
+    @Slot()
+    def _do_update(self) -> None:
+        self._update_timer.stop()
+        # repaint once all the rows are in place, the model signals are left
+        # alone since the view relies on them to track the rows but the
+        # current row may only be shown once the rows are settled
+        selection_model = self.tree_view.selectionModel()
+        blocker = None if selection_model is None else QSignalBlocker(selection_model)
+        self.tree_view.setUpdatesEnabled(False)
+        self.stacked_widget.setUpdatesEnabled(False)
+        try:
+            for idx, renderer in enumerate(self.renderers):
+                if idx == len(self._renderer_items):
+                    top_item = self._new_row(f"Renderer {idx}", renderer)
+                    self.tree_model.appendRow(top_item)
+                    self._renderer_items.append(top_item)
+                    self._props_mtimes.append(None)
+                # the actor rows of a collapsed renderer are only listed once
+                # it is expanded
+                if self.tree_view.isExpanded(self._renderer_items[idx].index()):
+                    self._update_renderer(idx)
+        finally:
+            self.stacked_widget.setUpdatesEnabled(True)
+            self.tree_view.setUpdatesEnabled(True)
+            if blocker is not None:
+                blocker.unblock()
+        if selection_model is not None:
+            self._current_changed(selection_model.currentIndex(), QModelIndex())
 
-    if prop is not None:
-        # opacity
-        tmp_layout = QHBoxLayout()
-        opacity = QDoubleSpinBox()
-        opacity.setMaximum(1.0)
-        opacity.setValue(prop.GetOpacity())
-        set_opacity_ref = weakref.ref(prop.SetOpacity)
+    def _update_renderer(self, idx: int) -> None:
+        renderer = self.renderers[idx]
+        # adding or removing an actor modifies the prop collection, the
+        # renderers left untouched since the last update are skipped
+        props_mtime = renderer.GetViewProps().GetMTime()
+        if props_mtime == self._props_mtimes[idx]:
+            return
+        self._props_mtimes[idx] = props_mtime
+        self._update_actor_items(idx, renderer)
 
-        def _set_opacity(opacity: float) -> None:  # pragma: no cover
-            set_opacity = set_opacity_ref()
-            if set_opacity is not None:
-                set_opacity(opacity)
+    def _update_actor_items(self, idx: int, renderer: Renderer) -> None:
+        # bound once, this loop runs for every actor of the renderer
+        actor_items = self._actor_items
+        append_row = self._renderer_items[idx].appendRow
+        new_row = self._new_row
+        listed = set()
+        actors = list(renderer._actors.items())  # pylint: disable=protected-access
+        for name, actor in actors:
+            if actor is None:
+                continue
+            key = (idx, name)
+            entry = actor_items.get(key)
+            if entry is not None and entry[1]() is not actor:
+                self._remove_actor_item(key)
+                entry = None
+            if entry is None:
+                child_item = new_row(name, actor)
+                append_row(child_item)
+                actor_items[key] = (child_item, weakref.ref(actor))
+            listed.add(name)
+        stale = [key for key in actor_items if key[0] == idx and key[1] not in listed]
+        for key in stale:
+            self._remove_actor_item(key)
 
-        opacity.valueChanged.connect(_set_opacity)
-        tmp_layout.addWidget(QLabel("Opacity"))
-        tmp_layout.addWidget(opacity)
-        layout.addLayout(tmp_layout)
+    def _remove_actor_item(self, key: Tuple[int, str]) -> None:
+        item, _ = self._actor_items.pop(key)
+        row_id = item.data(_USER_ROLE)
+        del self._row_targets[row_id]
+        item.parent().removeRow(item.row())
 
-    widget.setLayout(layout)
-    return widget
+    @Slot()
+    def toggle(self) -> None:
+        """Toggle the editor visibility."""
+        if self.isVisible():
+            self.hide()
+        else:
+            if self._is_outdated():
+                self._do_update()
+            self.show()
@@ -27,25 +27,26 @@ Implementation
     +-- QtInteractor.__init__(parent=self.frame)
         |-- QVTKRenderWindowInteractor.__init__(parent=parent)
         |   +-- QWidget.__init__(parent, flags)
+        |       +-- _BasePlotterInitBarrier.__init__()  # no-op
         |-- BasePlotter.__init__(...)
         +-- self.ren_win = self.GetRenderWindow()
 
-Because ``QVTKRenderWindowInteractor`` calls ``QWidget.__init__``, this will
-actually trigger ``BasePlotter.__init__`` to be called with no arguments.
-This cannot be solved (at least) because using ``super()`` because
-``QVTKRenderWindowInteractor.__init__`` does not use ``super()``, and also it
-might not be fixable because Qt is doing something in ``QWidget`` which is
-probably entirely separate from the Python ``super()`` process.
-We fix this by internally by temporarily monkey-patching
-``BasePlotter.__init__`` with a no-op ``__init__``.
+Because ``QVTKRenderWindowInteractor`` calls ``QWidget.__init__``, PyQt
+continues the cooperative ``__init__`` chain with the next class in the MRO,
+which would call ``BasePlotter.__init__`` with no arguments. This cannot be
+solved with ``super()`` because ``QVTKRenderWindowInteractor.__init__`` does
+not use it. Instead, ``_BasePlotterInitBarrier`` sits between the Qt classes
+and ``BasePlotter`` in the MRO and ends the chain with a no-op ``__init__``,
+so ``BasePlotter.__init__`` is only called explicitly, with its arguments.
 """
+
 import contextlib
 import logging
 import os
 import platform
 import time
 import warnings
-from functools import wraps
+from functools import partial, wraps
 from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Type, Union
 
 import numpy as np  # type: ignore
@@ -57,11 +58,6 @@ try:
 except ImportError:  # PV < 0.40
     from pyvista.plotting.plotting import BasePlotter
 from pyvista.plotting.render_window_interactor import RenderWindowInteractor
-
-try:
-    from pyvista.core.utilities import conditional_decorator, threaded
-except ImportError:  # PV < 0.40
-    from pyvista.utilities import conditional_decorator, threaded
 from qtpy import QtCore, QtGui
 from qtpy.QtCore import QSize, QTimer, Signal
 from qtpy.QtWidgets import (
@@ -71,6 +67,7 @@ from qtpy.QtWidgets import (
     QGestureEvent,
     QGridLayout,
     QMenuBar,
+    QStackedLayout,
     QToolBar,
     QVBoxLayout,
     QWidget,
@@ -105,46 +102,113 @@ LOG.addHandler(logging.StreamHandler())
 # LOG = logging.getLogger(__name__)
 # LOG.setLevel('DEBUG')
 
+_IS_DARWIN = platform.system() == "Darwin"
+
 SAVE_CAM_BUTTON_TEXT = "Save Camera"
 CLEAR_CAMS_BUTTON_TEXT = "Clear Cameras"
+# Label, viewing vector and view up vector of the camera toolbar actions
+_CAMERA_VIEWS = (
+    ("Top (-Z)", (0, 0, 1), (0, 1, 0)),
+    ("Bottom (+Z)", (0, 0, -1), (0, 1, 0)),
+    ("Front (-Y)", (0, 1, 0), (0, 0, 1)),
+    ("Back (+Y)", (0, -1, 0), (0, 0, 1)),
+    ("Left (-X)", (1, 0, 0), (0, 0, 1)),
+    ("Right (+X)", (-1, 0, 0), (0, 0, 1)),
+    ("Isometric", (1, 1, 1), (0, 0, 1)),
+)
+# QImage format of the icon arrays, by number of channels
+_QIMAGE_FORMATS = {
+    3: QtGui.QImage.Format_RGB888,
+    4: QtGui.QImage.Format_RGBA8888,
+}
+
+
+def _downsample(arr: np.ndarray, s_x: int, s_y: int) -> np.ndarray:
+    """Average each s_x by s_y block of an image (box filter)."""
+    n_x, n_y = arr.shape[0] // s_x, arr.shape[1] // s_y
+    integer = np.issubdtype(arr.dtype, np.integer)
+    # Summing the columns then the rows of the blocks with reduceat is a few
+    # times faster than a mean over a strided 5D view, and integer images
+    # are accumulated and rounded without going through floats
+    sums = np.add.reduceat(
+        arr[: n_x * s_x, : n_y * s_y],
+        np.arange(0, n_y * s_y, s_y),
+        axis=1,
+        dtype=np.int64 if integer else np.float64,
+    )
+    sums = np.add.reduceat(sums, np.arange(0, n_x * s_x, s_x), axis=0)
+    count = s_x * s_y
+    if integer:
+        return (sums + count // 2) // count
+    return sums / count
+
+
+def _paste_centered(
+    small: np.ndarray, size: int, dtype: np.dtype, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Center an image in a square of the given size with a black border."""
+    n_x, n_y, n_channels = small.shape
+    shape = (size, size, n_channels)
+    if out is not None and out.shape == shape and out.dtype == dtype:
+        img = out
+    else:
+        img = np.empty(shape, dtype=dtype)
+    # only the border around the image needs to be zeroed
+    x_l = (size - n_x) // 2
+    y_l = (size - n_y) // 2
+    img[:x_l] = 0
+    img[x_l + n_x :] = 0
+    img[x_l : x_l + n_x, :y_l] = 0
+    img[x_l : x_l + n_x, y_l + n_y :] = 0
+    img[x_l : x_l + n_x, y_l : y_l + n_y] = small
+    return img
 
 
-def resample_image(arr: np.ndarray, max_size: int = 400) -> np.ndarray:
-    """Resample a square image to an image of max_size."""
-    dim = np.max(arr.shape[0:2])
+def resample_image(
+    arr: np.ndarray, max_size: int = 400, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Resample a square image to an image of max_size.
+
+    The result is written to ``out`` when it has the right shape and dtype.
+    """
+    dim = max(arr.shape[0], arr.shape[1])
     max_size = min(max_size, dim)
     x_size, y_size, _ = arr.shape
-    s_x = int(np.ceil(x_size / max_size))
-    s_y = int(np.ceil(y_size / max_size))
-    img = np.zeros((max_size, max_size, arr.shape[2]), dtype=arr.dtype)
-    arr = arr[0:-1:s_x, 0:-1:s_y, :]
-    x_l = (max_size - arr.shape[0]) // 2
-    y_l = (max_size - arr.shape[1]) // 2
-    img[x_l : arr.shape[0] + x_l, y_l : arr.shape[1] + y_l, :] = arr
-    return img
+    # ceiling divisions
+    s_x = -(-x_size // max_size)
+    s_y = -(-y_size // max_size)
+    return _paste_centered(_downsample(arr, s_x, s_y), max_size, arr.dtype, out)
+
+
+def pad_image(
+    arr: np.ndarray, max_size: int = 400, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Pad an image to a square then resamples to max_size.
+
+    The result is written to ``out`` when it has the right shape and dtype.
+    """
+    # the image is resampled with the step of its padded square and pasted
+    # in the middle of the result, so the square is never built
+    dim = max(arr.shape[0], arr.shape[1])
+    max_size = min(max_size, dim)
+    step = -(-dim // max_size)  # ceiling division
+    return _paste_centered(_downsample(arr, step, step), max_size, arr.dtype, out)
 
 
-def pad_image(arr: np.ndarray, max_size: int = 400) -> np.ndarray:
-    """Pad an image to a square then resamples to max_size."""
-    dim = np.max(arr.shape)
-    img = np.zeros((dim, dim, arr.shape[2]), dtype=arr.dtype)
-    x_l = (dim - arr.shape[0]) // 2
-    y_l = (dim - arr.shape[1]) // 2
-    img[x_l : arr.shape[0] + x_l, y_l : arr.shape[1] + y_l, :] = arr
-    return resample_image(img, max_size=max_size)
+# pylint: disable=too-few-public-methods
+class _BasePlotterInitBarrier:
+    """End the cooperative ``__init__`` chain of the Qt base classes.
 
+    PyQt calls the next ``__init__`` in the MRO once the Qt classes are
+    initialized. This sits between them and BasePlotter, which is then
+    initialized explicitly and with its own arguments.
+    """
 
-@contextlib.contextmanager
-def _no_base_plotter_init() -> Generator[None, None, None]:
-    init = BasePlotter.__init__
-    BasePlotter.__init__ = lambda *args, **kwargs: None
-    try:
-        yield
-    finally:
-        BasePlotter.__init__ = init
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        pass
 
 
-class QtInteractor(QVTKRenderWindowInteractor, BasePlotter):
+class QtInteractor(QVTKRenderWindowInteractor, _BasePlotterInitBarrier, BasePlotter):
     """Extend QVTKRenderWindowInteractor class.
 
     This adds the methods available to pyvista.Plotter.
@@ -201,6 +265,8 @@ class QtInteractor(QVTKRenderWindowInteractor, BasePlotter):
         """Initialize Qt interactor."""
         LOG.debug("QtInteractor init start")
         self.url: QtCore.QUrl = None
+        self.render_timer: QTimer = None
+        self._render_suppressed = 0
 
         # Cannot use super() here because
         # QVTKRenderWindowInteractor silently swallows all kwargs
@@ -209,35 +275,51 @@ class QtInteractor(QVTKRenderWindowInteractor, BasePlotter):
         for key in ("stereo", "iren", "rw", "wflags"):
             if key in kwargs:
                 qvtk_kwargs[key] = kwargs.pop(key)
-        with _no_base_plotter_init():
-            QVTKRenderWindowInteractor.__init__(self, **qvtk_kwargs)
+        QVTKRenderWindowInteractor.__init__(self, **qvtk_kwargs)
         BasePlotter.__init__(self, **kwargs)
         # backward compat for when we had this as a separate class
         self.interactor = self
 
+        # Read the theme once; it may be swapped between plotters, so it
+        # cannot be cached at import time
+        theme = global_theme
         if multi_samples is None:
-            multi_samples = global_theme.multi_samples
+            multi_samples = theme.multi_samples
 
         self.setAcceptDrops(True)
 
         # Create and start the interactive renderer
         self.ren_win = self.GetRenderWindow()
         self.ren_win.SetMultiSamples(multi_samples)
-        if line_smoothing:
-            self.ren_win.LineSmoothingOn()
-        if point_smoothing:
-            self.ren_win.PointSmoothingOn()
-        if polygon_smoothing:
-            self.ren_win.PolygonSmoothingOn()
-
+        # Smoothing is off by default, so only touch the window when asked
+        if line_smoothing or point_smoothing or polygon_smoothing:
+            self.ren_win.SetLineSmoothing(bool(line_smoothing))
+            self.ren_win.SetPointSmoothing(bool(point_smoothing))
+            self.ren_win.SetPolygonSmoothing(bool(polygon_smoothing))
+
+        # Set up every renderer in one pass, resetting its camera only once
+        # the rest of its state is in place
+        depth_peeling = theme.depth_peeling["enabled"] and self.enable_depth_peeling()
         for renderer in self.renderers:
-            renderer.view_isometric()
             self.ren_win.AddRenderer(renderer)
-
-        self.render_signal.connect(self._render)
+            if depth_peeling:
+                renderer.enable_depth_peeling()
+            renderer.view_isometric(render=False)
+        self.ren_win.Modified()
+
+        # macOS needs the render to be deferred to the event loop; queue it
+        # there rather than emitting from a new thread on every render
+        self.render_signal.connect(
+            self._render,
+            (
+                QtCore.Qt.ConnectionType.QueuedConnection
+                if _IS_DARWIN
+                else QtCore.Qt.ConnectionType.AutoConnection
+            ),
+        )
         self.key_press_event_signal.connect(super().key_press_event)
 
-        self.background_color = global_theme.background
+        self.background_color = theme.background
         if self.title:
             self.setWindowTitle(title)
 
@@ -253,20 +335,18 @@ class QtInteractor(QVTKRenderWindowInteractor, BasePlotter):
 
         # Make the render timer but only activate if using auto update
         self.render_timer = QTimer(parent=parent)
-        if float(auto_update) > 0.0:  # Can be False as well
+        self._twait: Optional[int] = None
+        auto_update = float(auto_update)  # Can be False as well
+        if auto_update > 0.0:
             # Spawn a thread that updates the render window.
             # Sometimes directly modifying object data doesn't trigger
             # Modified() and upstream objects won't be updated.  This
             # ensures the render window stays updated without consuming too
             # many resources.
-            twait = int((auto_update**-1) * 1000.0)
-            self.render_timer.timeout.connect(self.render)
-            self.render_timer.start(twait)
-
-        if global_theme.depth_peeling["enabled"]:
-            if self.enable_depth_peeling():
-                for renderer in self.renderers:
-                    renderer.enable_depth_peeling()
+            # a huge rate must not turn into a zero (busy) interval
+            self._twait = max(1, round(1000.0 / auto_update))
+            self.render_timer.timeout.connect(self._auto_render)
+            self.render_timer.start(self._twait)
 
         # Set some private attributes that let BasePlotter know
         #   that this is safely rendering
@@ -312,9 +392,46 @@ class QtInteractor(QVTKRenderWindowInteractor, BasePlotter):
         """Wrap ``BasePlotter.render``."""
         return BasePlotter.render(self, *args, **kwargs)
 
-    @conditional_decorator(threaded, platform.system() == "Darwin")
+    def _auto_render(self) -> None:
+        """Render on a timer tick unless the result cannot be seen."""
+        # Off-screen windows are never visible but their images are read
+        # back, and the first render is still needed to mark the plotter
+        # as rendered
+        if (
+            self.isVisible()
+            or self.ren_win.GetOffScreenRendering()
+            or not self._rendered
+        ):
+            self.render()
+
+    @contextlib.contextmanager
+    def batch_render(self) -> Generator[None, None, None]:
+        """Suppress rendering within the context and render once on exit.
+
+        Adding many meshes renders the scene after each of them, which
+        this avoids. The contexts can be nested.
+
+        Examples
+        --------
+        >>> import pyvista as pv
+        >>> from pyvistaqt import BackgroundPlotter
+        >>> plotter = BackgroundPlotter()
+        >>> with plotter.batch_render():
+        ...     for i in range(3):
+        ...         _ = plotter.add_mesh(pv.Sphere(center=(i, 0, 0)))
+        """
+        self._render_suppressed += 1
+        try:
+            yield
+        finally:
+            self._render_suppressed -= 1
+            if not self._render_suppressed:
+                self.render()
+
     def render(self) -> None:
         """Override the ``render`` method to handle threading issues."""
+        if self._render_suppressed:
+            return None
         self._rendered = True  # Crucial for BasePlotter to know this has rendered
         try:
             return self.render_signal.emit()
@@ -356,16 +473,19 @@ class QtInteractor(QVTKRenderWindowInteractor, BasePlotter):
 
         """
         if other_views is None:
-            other_views = np.arange(len(other_plotter.renderers))
+            other_views = range(len(other_plotter.renderers))
         elif isinstance(other_views, int):
-            other_views = np.asarray([other_views])
+            other_views = (other_views,)
         else:
-            other_views = np.asarray(other_views)
+            other_views = tuple(other_views)
 
-        if not np.issubdtype(other_views.dtype, int):
+        if not all(
+            isinstance(index, (int, np.integer)) and not isinstance(index, bool)
+            for index in other_views
+        ):
             raise TypeError(
                 "Expected `other_views` type is int, or list or tuple of ints, "
-                f"but {other_views.dtype} is given"
+                f"but {np.asarray(other_views).dtype} is given"
             )
 
         renderer = self.renderers[view]
@@ -380,23 +500,22 @@ class QtInteractor(QVTKRenderWindowInteractor, BasePlotter):
         exist.  User can drop anything in this window and we only want
         to allow files.
         """
-        try:
-            for url in event.mimeData().urls():
-                if os.path.isfile(url.path()):
-                    # only call accept on files
-                    event.accept()
-        except IOError as exception:  # pragma: no cover
-            warnings.warn(f"Exception when dragging files: {str(exception)}")
+        # os.path.isfile never raises, and a single file is enough to accept
+        urls = event.mimeData().urls()
+        if any(os.path.isfile(url.path()) for url in urls):
+            event.accept()
 
     # pylint: disable=invalid-name,useless-return
     def dropEvent(self, event: QtCore.QEvent) -> None:
         """Event is called after dragEnterEvent."""
         try:
-            for url in event.mimeData().urls():
-                self.url = url
-                filename = self.url.path()
-                if os.path.isfile(filename):
-                    self.add_mesh(pyvista.read(filename))
+            # several dropped files only need a single render
+            with self.batch_render():
+                for url in event.mimeData().urls():
+                    self.url = url
+                    filename = self.url.path()
+                    if os.path.isfile(filename):
+                        self.add_mesh(pyvista.read(filename))
         except IOError as exception:  # pragma: no cover
             warnings.warn(f"Exception when dropping files: {str(exception)}")
 
@@ -404,7 +523,7 @@ class QtInteractor(QVTKRenderWindowInteractor, BasePlotter):
         """Quit application."""
         if self._closed:
             return
-        if hasattr(self, "render_timer"):
+        if self.render_timer is not None:
             self.render_timer.stop()
         BasePlotter.close(self)
         QVTKRenderWindowInteractor.close(self)
@@ -539,6 +658,7 @@ class BackgroundPlotter(QtInteractor):
         self.default_camera_tool_bar: QToolBar = None
         self.saved_camera_positions: Optional[list] = None
         self.saved_cameras_tool_bar: QToolBar = None
+        self._saved_cam_actions: List[QAction] = []
         # menu bar
         self.main_menu: QMenuBar = None
         self._edl_action: QAction = None
@@ -551,6 +671,7 @@ class BackgroundPlotter(QtInteractor):
         self.active = True
         self.counters: List[Counter] = []
         self.allow_quit_keypress = allow_quit_keypress
+        self._last_window_size: Optional[Tuple[int, int]] = None
 
         if window_size is None:
             window_size = global_theme.window_size
@@ -563,9 +684,10 @@ class BackgroundPlotter(QtInteractor):
         self.off_screen = _setup_off_screen(off_screen)
         if app_window_class is None:
             app_window_class = MainWindow
-        self.app_window = app_window_class(
-            title=kwargs.get("title", global_theme.title)
-        )
+        title = kwargs.get("title")
+        if title is None:
+            title = global_theme.title
+        self.app_window = app_window_class(title=title)
         self.frame = QFrame(parent=self.app_window)
         self.frame.setFrameStyle(QFrame.NoFrame)
         vlayout = QVBoxLayout()
@@ -577,6 +699,7 @@ class BackgroundPlotter(QtInteractor):
         self.app_window.grabGesture(QtCore.Qt.PinchGesture)
         self.app_window.signal_gesture.connect(self.gesture_event)
         self.app_window.signal_close.connect(self._close)
+        self.app_window.signal_minimized.connect(self._pause_render_timer)
 
         if menu_bar:
             self.add_menu_bar()
@@ -589,9 +712,13 @@ class BackgroundPlotter(QtInteractor):
             self.app_window.show()
 
         self.window_size = window_size
-        self._last_update_time = -np.inf
+        self._last_update_time = float("-inf")
         self._last_window_size = self.window_size
-        self._last_camera_pos = self.camera_position
+        # The camera MTime changes whenever it moves, and is cheaper to read
+        # and compare than the camera position
+        self._last_camera_mtime = self.camera.GetMTime()
+        self._icon_buf: Optional[np.ndarray] = None
+        self._icon_keepalive: Optional[np.ndarray] = None
 
         if update_app_icon:
             self.add_callback(self.update_app_icon)
@@ -645,30 +772,38 @@ class BackgroundPlotter(QtInteractor):
     def _close(self) -> None:
         super().close()
 
+    def _pause_render_timer(self, minimized: bool) -> None:
+        # nothing can be seen while the window is minimized
+        if self._twait is None or self._closed:
+            return
+        if minimized:
+            self.render_timer.stop()
+        else:
+            self.render_timer.start(self._twait)
+
     def update_app_icon(self) -> None:
         """Update the app icon if the user is not trying to resize the window."""
-        if os.name == "nt" or not hasattr(
-            self, "_last_window_size"
-        ):  # pragma: no cover
+        if os.name == "nt":  # pragma: no cover
             # DO NOT EVEN ATTEMPT TO UPDATE ICON ON WINDOWS
             return
-        cur_time = time.time()
         if self._last_window_size != self.window_size:  # pragma: no cover
             # Window size hasn't remained constant since last render.
             # This means the user is resizing it so ignore update.
             pass
         elif (
-            cur_time - self._last_update_time > BackgroundPlotter.ICON_TIME_STEP
-        ) and self._last_camera_pos != self.camera_position:
+            time.monotonic() - self._last_update_time > BackgroundPlotter.ICON_TIME_STEP
+        ) and self._last_camera_mtime != self.camera.GetMTime():
             # its been a while since last update OR
             # the camera position has changed and its been at least one second
 
             # Update app icon as preview of the window
-            self.set_icon(pad_image(self.image))
+            # the icon buffer is reused while the image format is stable
+            self._icon_buf = pad_image(self.image, out=self._icon_buf)
+            self.set_icon(self._icon_buf)
 
             # Update trackers
-            self._last_update_time = cur_time
-            self._last_camera_pos = self.camera_position
+            self._last_update_time = time.monotonic()
+            self._last_camera_mtime = self.camera.GetMTime()
         # Update trackers
         self._last_window_size = self.window_size
 
@@ -699,11 +834,13 @@ class BackgroundPlotter(QtInteractor):
                 "shape[2] == 3 or 4, or str"
             )
         if isinstance(img, np.ndarray):
-            fmt_str = "Format_RGB"
-            fmt_str += ("A8" if img.shape[2] == 4 else "") + "888"
-            fmt = getattr(QtGui.QImage, fmt_str)
+            fmt = _QIMAGE_FORMATS[img.shape[2]]
+            # QPixmap.fromImage makes its own copy, the array only has to
+            # outlive the QImage wrapping it
+            arr = np.ascontiguousarray(img)
+            self._icon_keepalive = arr
             img = QtGui.QPixmap.fromImage(
-                QtGui.QImage(img.copy(), img.shape[1], img.shape[0], fmt)
+                QtGui.QImage(arr, arr.shape[1], arr.shape[0], arr.strides[0], fmt)
             )
         # Currently no way to check if str/path is actually correct (want to
         # allow resource paths and the like so os.path.isfile is no good)
@@ -797,30 +934,34 @@ class BackgroundPlotter(QtInteractor):
 
     def save_camera_position(self) -> None:
         """Save camera position to saved camera menu for recall."""
+        # pylint: disable=attribute-defined-outside-init
+        self.camera_position: Any
+        # every access builds a new CameraPosition, so read it only once
+        camera_position = self.camera_position
         if self.saved_camera_positions is not None:
-            # pylint: disable=attribute-defined-outside-init
-            self.camera_position: Any
-            self.saved_camera_positions.append(self.camera_position)
+            self.saved_camera_positions.append(camera_position)
             ncam = len(self.saved_camera_positions)
-        if self.camera_position is not None:
-            camera_position: Any = self.camera_position[:]  # py2.7 copy compatibility
 
-        if hasattr(self, "saved_cameras_tool_bar"):
+        if self.saved_cameras_tool_bar is not None:
 
             def load_camera_position() -> None:
                 # pylint: disable=attribute-defined-outside-init
                 self.camera_position = camera_position
 
-            self.saved_cameras_tool_bar.addAction(f"Cam {ncam}", load_camera_position)
+            self._saved_cam_actions.append(
+                self.saved_cameras_tool_bar.addAction(
+                    f"Cam {ncam}", load_camera_position
+                )
+            )
             if ncam < 10:
                 self.add_key_event(str(ncam), load_camera_position)
 
     def clear_camera_positions(self) -> None:
         """Clear all camera positions."""
-        if hasattr(self, "saved_cameras_tool_bar"):
-            for action in self.saved_cameras_tool_bar.actions():
-                if action.text() not in [SAVE_CAM_BUTTON_TEXT, CLEAR_CAMS_BUTTON_TEXT]:
-                    self.saved_cameras_tool_bar.removeAction(action)
+        if self.saved_cameras_tool_bar is not None:
+            for action in self._saved_cam_actions:
+                self.saved_cameras_tool_bar.removeAction(action)
+        self._saved_cam_actions.clear()
         self.saved_camera_positions = []
 
     def _add_action(self, tool_bar: QToolBar, key: str, method: Any) -> QAction:
@@ -829,27 +970,26 @@ class BackgroundPlotter(QtInteractor):
         tool_bar.addAction(action)
         return action
 
+    def _set_view(self, vector: tuple, viewup: tuple, *_: Any) -> None:
+        """Set the camera view, ignoring the ``checked`` argument of actions."""
+        self.view_vector(vector, viewup)
+
     def add_toolbars(self) -> None:
-        """Add the toolbars."""
+        """Add the toolbars.
+
+        Calling it again has no effect, so the actions are never connected
+        twice.
+        """
+        if self.default_camera_tool_bar is not None:
+            return
         # Camera toolbar
         self.default_camera_tool_bar = self.app_window.addToolBar("Camera Position")
 
-        def _view_vector(*args: Any) -> None:
-            return self.view_vector(*args)
-
-        cvec_setters = {
-            # Viewing vector then view up vector
-            "Top (-Z)": lambda: _view_vector((0, 0, 1), (0, 1, 0)),
-            "Bottom (+Z)": lambda: _view_vector((0, 0, -1), (0, 1, 0)),
-            "Front (-Y)": lambda: _view_vector((0, 1, 0), (0, 0, 1)),
-            "Back (+Y)": lambda: _view_vector((0, -1, 0), (0, 0, 1)),
-            "Left (-X)": lambda: _view_vector((1, 0, 0), (0, 0, 1)),
-            "Right (+X)": lambda: _view_vector((-1, 0, 0), (0, 0, 1)),
-            "Isometric": lambda: _view_vector((1, 1, 1), (0, 0, 1)),
-        }
-        for key, method in cvec_setters.items():
+        for key, vector, viewup in _CAMERA_VIEWS:
             self._view_action = self._add_action(
-                self.default_camera_tool_bar, key, method
+                self.default_camera_tool_bar,
+                key,
+                partial(self._set_view, vector, viewup),
             )
         # pylint: disable=unnecessary-lambda
         self._add_action(
@@ -872,7 +1012,13 @@ class BackgroundPlotter(QtInteractor):
         )
 
     def add_menu_bar(self) -> None:
-        """Add the main menu bar."""
+        """Add the main menu bar.
+
+        Calling it again has no effect, so the actions are never connected
+        twice.
+        """
+        if self.main_menu is not None:
+            return
         self.main_menu = _create_menu_bar(parent=self.app_window)
         self.app_window.signal_close.connect(self.main_menu.clear)
 
@@ -894,7 +1040,7 @@ class BackgroundPlotter(QtInteractor):
         tool_menu.addAction("Enable Cell Picking (through)", self.enable_cell_picking)
         tool_menu.addAction(
             "Enable Cell Picking (visible)",
-            lambda: self.enable_cell_picking(through=False),
+            partial(self.enable_cell_picking, through=False),
         )
 
         cam_menu = view_menu.addMenu("Camera")
@@ -920,7 +1066,12 @@ class BackgroundPlotter(QtInteractor):
         view_menu.addSeparator()
 
     def add_editor(self) -> None:
-        """Add the editor."""
+        """Add the editor.
+
+        Calling it again has no effect.
+        """
+        if self.editor is not None:
+            return
         self.editor = Editor(parent=self.app_window, renderers=self.renderers)
         self._editor_action = self.main_menu.addAction("Editor", self.editor.toggle)
         self.app_window.signal_close.connect(self.editor.close)
@@ -949,6 +1100,10 @@ class MultiPlotter:
     off_screen : bool, optional
         Renders off screen when True.  Useful for automated
         screenshots or debug testing.
+    stacked : bool
+        Show a single plotter of the grid at a time, selected with
+        ``set_active``. The hidden plotters are not rendered by their
+        auto update. Defaults to False.
 
     Examples
     --------
@@ -970,6 +1125,7 @@ class MultiPlotter:
         window_size: Optional[Tuple[int, int]] = None,
         title: Optional[str] = None,
         off_screen: Optional[bool] = None,
+        stacked: bool = False,
         **kwargs: Any,
     ) -> None:
         """Initialize the multi plotter."""
@@ -980,6 +1136,7 @@ class MultiPlotter:
         _check_type(window_size, "window_size", [tuple, type(None)])
         _check_type(title, "title", [str, type(None)])
         _check_type(off_screen, "off_screen", [bool, type(None)])
+        _check_type(stacked, "stacked", [bool])
         self.ipython = _setup_ipython()
         self.app = _setup_application(app)
         self.off_screen = _setup_off_screen(off_screen)
@@ -987,17 +1144,24 @@ class MultiPlotter:
         self._ncols = ncols
         self._window = MainWindow(title=title, size=window_size)
         self._central_widget = QWidget(parent=self._window)
-        self._layout = QGridLayout()
-        self._plotter = None
+        self._stacked = stacked
+        self._layout = QStackedLayout() if stacked else QGridLayout()
         self._plotters = [None] * (self._nrows * self._ncols)
         kwargs.update(show=False)  # only show main window
         kwargs.update(allow_quit_keypress=False)  # dynamic removal is not supported
-        for row in range(self._nrows):
-            for col in range(self._ncols):
-                self._plotter = BackgroundPlotter(off_screen=self.off_screen, **kwargs)
-                self._window.signal_close.connect(self._plotter.close)
-                self.__setitem__((row, col), self._plotter)
-                self._layout.addWidget(self._plotter.app_window, row, col)
+        # the plotters are stored row by row
+        for index in range(self._nrows * self._ncols):
+            row, col = divmod(index, self._ncols)
+            plotter = BackgroundPlotter(off_screen=self.off_screen, **kwargs)
+            if kwargs.get("update_app_icon") is None:
+                # the logo is the icon of the whole app, set it only once
+                kwargs.update(update_app_icon=False)
+            self._window.signal_close.connect(plotter.close)
+            self._plotters[index] = plotter
+            if stacked:
+                self._layout.addWidget(plotter.app_window)
+            else:
+                self._layout.addWidget(plotter.app_window, row, col)
         self._central_widget.setLayout(self._layout)
         self._window.setCentralWidget(self._central_widget)
         if show:
@@ -1012,6 +1176,19 @@ class MultiPlotter:
         """Close the multi plotter."""
         self._window.close()
 
+    def set_active(self, idx: Tuple[int, int]) -> None:
+        """Show a single plotter of a stacked multi plotter.
+
+        Parameters
+        ----------
+        idx : tuple
+            The index ``(row, col)`` of the plotter to show.
+        """
+        if not self._stacked:
+            raise ValueError("set_active requires a MultiPlotter with stacked=True")
+        row, col = idx
+        self._layout.setCurrentIndex(row * self._ncols + col)
+
     def __setitem__(self, idx: Tuple[int, int], plotter: Any) -> None:
         """Set a valid plotter in the grid.
 
@@ -1041,8 +1218,7 @@ class MultiPlotter:
             The selected plotter.
         """
         row, col = idx
-        self._plotter = self._plotters[row * self._ncols + col]
-        return self._plotter
+        return self._plotters[row * self._ncols + col]
 
 
 class _FakeEventHandler:
@@ -1,9 +1,10 @@
 """This module contains utilities routines."""
 
-from typing import Any, List, Optional, Type
+from typing import Any, Callable, List, Optional, Type
 
 import pyvista
 import scooby  # type: ignore
+from qtpy.QtCore import QObject, QSignalBlocker
 from qtpy.QtWidgets import QApplication, QMenuBar
 
 
@@ -16,6 +17,16 @@ def _check_type(var: Any, var_name: str, var_types: List[Type[Any]]) -> None:
         )
 
 
+def _blocked(widget: QObject, setter: Callable[[Any], Any], value: Any) -> None:
+    """Call a setter of a widget without emitting its signals."""
+    # unblock explicitly, not all bindings make the blocker a context manager
+    blocker = QSignalBlocker(widget)
+    try:
+        setter(value)
+    finally:
+        blocker.unblock()
+
+
 def _create_menu_bar(parent: Any) -> QMenuBar:
     """Create a menu bar.
 
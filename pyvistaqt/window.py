@@ -12,6 +12,7 @@ class MainWindow(QMainWindow):
 
     signal_close = Signal()
     signal_gesture = Signal(QtCore.QEvent)
+    signal_minimized = Signal(bool)
 
     def __init__(
         self,
@@ -31,6 +32,8 @@ class MainWindow(QMainWindow):
         if event.type() == QtCore.QEvent.Gesture:  # pragma: no cover
             self.signal_gesture.emit(event)
             return True
+        if event.type() == QtCore.QEvent.WindowStateChange:
+            self.signal_minimized.emit(self.isMinimized())
         return super().event(event)
 
     def closeEvent(self, event: QtCore.QEvent) -> None:  # pylint: disable=invalid-name
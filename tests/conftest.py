@@ -119,4 +119,7 @@ def no_qt(monkeypatch):
     monkeypatch.undo()
     if need_reload:
         importlib.reload(pyvistaqt)
+        # the binding is only probed once a plotting class is accessed
+        assert 'qtpy' not in sys.modules
+        pyvistaqt.BackgroundPlotter
         assert 'qtpy' in sys.modules
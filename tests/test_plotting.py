@@ -15,8 +15,10 @@ from qtpy.QtWidgets import QAction, QFrame, QMenuBar, QToolBar, QVBoxLayout
 from qtpy import QtCore, API_NAME
 from qtpy.QtCore import Qt, QPoint, QPointF, QMimeData, QUrl
 from qtpy.QtGui import QDragEnterEvent, QDropEvent
-from qtpy.QtWidgets import (QTreeWidget, QStackedWidget, QCheckBox,
-                            QGestureEvent, QPinchGesture)
+from qtpy.QtGui import QStandardItemModel
+from qtpy.QtWidgets import (QTreeView, QStackedWidget, QCheckBox,
+                            QGestureEvent, QPinchGesture, QFileDialog,
+                            QDoubleSpinBox)
 from pyvistaqt.plotting import global_theme
 from pyvista.plotting import Renderer
 try:
@@ -27,9 +29,11 @@ except ImportError:  # PV < 0.40
 import pyvistaqt
 from pyvistaqt import MultiPlotter, BackgroundPlotter, MainWindow, QtInteractor
 from pyvistaqt.plotting import Counter, QTimer, QVTKRenderWindowInteractor
+from pyvistaqt.plotting import pad_image
 from pyvistaqt.editor import Editor
 from pyvistaqt.dialog import FileDialog
-from pyvistaqt.utils import _setup_application, _create_menu_bar, _check_type
+from pyvistaqt.utils import (_setup_application, _create_menu_bar, _check_type,
+                             _blocked)
 
 
 PV_VERSION = Version(pyvista.__version__)
@@ -89,13 +93,17 @@ def test_setup_application(qapp):
 
 
 def test_file_dialog(tmpdir, qtbot):
+    window = MainWindow()
+    qtbot.addWidget(window)
     dialog = FileDialog(
+        parent=window,
         filefilter=None,
         directory=False,
         save_mode=False,
         show=False,
     )
     qtbot.addWidget(dialog)
+    assert dialog.testOption(QFileDialog.DontUseCustomDirectoryIcons)
 
     dialog.emit_accepted()  # test no result
 
@@ -117,6 +125,33 @@ def test_file_dialog(tmpdir, qtbot):
         dialog.accept()
     assert not dialog.isVisible()  # dialog is closed after accept()
 
+    # a new dialog of the same window opens in the directory of the last
+    # accepted file, which is not recorded for the other windows
+    dialog = FileDialog(
+        parent=window, filefilter=[" A (*.a)", "A (*.a)", ""], show=False
+    )
+    assert dialog.nameFilters() == ["A (*.a)"]
+    assert os.path.samefile(dialog.directory().absolutePath(), os.path.dirname(filename))
+    other = MainWindow()
+    qtbot.addWidget(other)
+    assert other not in FileDialog._last_directories
+
+
+def test_pad_image():
+    img = np.full((768, 1024, 3), 200, np.uint8)
+    img[:, :4] = 0
+    icon = pad_image(img)
+    assert icon.shape == (400, 400, 3)
+    assert icon.dtype == np.uint8
+    # the image is centered with a zeroed border
+    assert (icon[0] == 0).all() and (icon[:, 0] == 0).all()
+    assert (icon[200, 31:370] == 200).all()
+    # the blocks are averaged rather than sampled
+    assert 0 < icon[200, 30, 0] < 200
+    # a matching buffer is reused, other ones are replaced
+    assert pad_image(img, out=icon) is icon
+    assert pad_image(img, out=icon[:, :, :2]) is not icon
+
 
 def test_check_type():
     with pytest.raises(TypeError, match="Expected type"):
@@ -125,6 +160,17 @@ def test_check_type():
     _check_type("foo", "foo", [str])
 
 
+def test_blocked(qtbot):
+    checkbox = QCheckBox()
+    qtbot.addWidget(checkbox)
+    toggled = []
+    checkbox.toggled.connect(toggled.append)
+    _blocked(checkbox, checkbox.setChecked, True)
+    assert checkbox.isChecked()
+    assert not toggled
+    assert not checkbox.signalsBlocked()
+
+
 def test_mouse_interactions(qtbot):
     plotter = BackgroundPlotter()
     window = plotter.app_window
@@ -248,21 +294,24 @@ def test_editor(qtbot, plotting):
     plotter.subplot(1, 0)
     plotter.show_axes()
 
-    assert_hasattr(editor, "tree_widget", QTreeWidget)
-    tree_widget = editor.tree_widget
-    top_item = tree_widget.topLevelItem(0)  # any renderer will do
+    assert_hasattr(editor, "tree_view", QTreeView)
+    assert_hasattr(editor, "tree_model", QStandardItemModel)
+    tree_view = editor.tree_view
+    tree_model = editor.tree_model
+    top_item = tree_model.item(tree_model.rowCount() - 1)  # any renderer will do
     assert top_item is not None
 
     # simulate selection
-    with qtbot.wait_signals([tree_widget.itemSelectionChanged], timeout=2000):
-        top_item.setSelected(True)
+    selection_model = tree_view.selectionModel()
+    with qtbot.wait_signals([selection_model.currentChanged], timeout=2000):
+        tree_view.setCurrentIndex(top_item.index())
 
     # toggle all the renderer-associated checkboxes twice
     # to ensure that slots are called for True and False
     assert_hasattr(editor, "stacked_widget", QStackedWidget)
     stacked_widget = editor.stacked_widget
-    page_idx = top_item.data(0, Qt.ItemDataRole.UserRole)
-    page_widget = stacked_widget.widget(page_idx)
+    page_widget = stacked_widget.currentWidget()
+    assert page_widget is not None
     page_layout = page_widget.layout()
     number_of_widgets = page_layout.count()
     for widget_idx in range(number_of_widgets):
@@ -276,7 +325,58 @@ def test_editor(qtbot, plotting):
 
     # hide the editor for coverage
     editor.toggle()
+    assert not editor.isVisible()
+    # showing it again lists the actors added in the meantime
+    with qtbot.wait_exposed(editor):
+        editor.toggle()
+
+    # all the actor rows share a single page
+    renderer_item = tree_model.item(0)
+    # the actor rows are listed once the renderer is expanded
+    assert renderer_item.rowCount() == 0
+    tree_view.expand(renderer_item.index())
+    actor_item = renderer_item.child(renderer_item.rowCount() - 1)
+    renderer_page = stacked_widget.currentWidget()
+    tree_view.setCurrentIndex(actor_item.index())
+    assert stacked_widget.count() == 2
+    assert stacked_widget.currentWidget() is not renderer_page
+    opacity = stacked_widget.currentWidget().findChild(QDoubleSpinBox)
+    assert opacity is not None
+    assert not opacity.keyboardTracking()
+    assert opacity.maximum() == 1.0
+    # the page controls reach the actor
+    visibility = stacked_widget.currentWidget().findChild(QCheckBox)
+    visibility.setChecked(False)
+    qtbot.waitUntil(lambda: not actor.GetVisibility(), timeout=1000)
+    opacity.setValue(0.5)
+    qtbot.waitUntil(lambda: actor.GetProperty().GetOpacity() == 0.5, timeout=1000)
+    # the page is bound again to the actor when its row is selected
+    tree_view.setCurrentIndex(renderer_item.index())
+    assert stacked_widget.currentWidget() is renderer_page
+    tree_view.setCurrentIndex(actor_item.index())
+    assert not visibility.isChecked()
+    assert opacity.value() == 0.5
+
+    # only the changes since the last update are applied
+    n_rows = renderer_item.rowCount()
+    with qtbot.wait_signal(editor._update_timer.timeout, timeout=1000):
+        editor.update()
+    assert renderer_item.rowCount() == n_rows
+    assert stacked_widget.count() == 2
     plotter.remove_actor(actor)
+    # a burst of updates is applied once
+    with qtbot.wait_signal(editor._update_timer.timeout, timeout=1000):
+        editor.update()
+        editor.update()
+    assert renderer_item.rowCount() == n_rows - 1
+    assert stacked_widget.count() == 2
+    # a forced update lists the same rows
+    with qtbot.wait_signal(editor._update_timer.timeout, timeout=1000):
+        editor.invalidate()
+    assert renderer_item.rowCount() == n_rows - 1
+    # the page follows the row that became current
+    assert tree_view.currentIndex().data() == "Renderer 0"
+    assert stacked_widget.currentWidget().findChild(QCheckBox).text() == "Axes"
     plotter.close()
 
 
@@ -320,6 +420,11 @@ def test_qt_interactor(qtbot, plotting, ensure_closed):
     # ensure that self.render is called by the timer
     render_blocker = qtbot.wait_signals([render_timer.timeout], timeout=500)
     render_blocker.wait()
+    # but only renders while the widget can be seen
+    rendered = []
+    vtk_widget.render_signal.connect(lambda: rendered.append(True))
+    vtk_widget._auto_render()
+    assert not rendered
 
     window.add_sphere()
     assert np.any(window.vtk_widget.mesh.points)
@@ -387,16 +492,27 @@ def test_background_plotting_axes_scale(qtbot, show_plotter, plotting):
     with qtbot.wait_exposed(dlg):
         dlg.show()
     assert dlg.isVisible()
+    assert dlg.x_slider_group.parent() is dlg
 
     value = 2.0
     dlg.x_slider_group.value = value
-    assert plotter.scale[0] == value
+    # the rescale is deferred until the changes settle
+    qtbot.waitUntil(lambda: plotter.scale[0] == value, timeout=1000)
     dlg.x_slider_group.spinbox.setValue(-1)
     assert dlg.x_slider_group.value == 0
     dlg.x_slider_group.spinbox.setValue(1000.0)
     assert dlg.x_slider_group.value < 100
-
-    plotter._last_update_time = 0.0
+    # the slider follows the spinbox
+    dlg.x_slider_group.spinbox.setValue(3.0)
+    assert abs(dlg.x_slider_group.slider.value() - 3.0) < 1e-3
+    assert not dlg.x_slider_group.spinbox.keyboardTracking()
+    # a slider change reaches the callback once, through the group
+    emitted = []
+    dlg.x_slider_group.value_changed.connect(emitted.append)
+    dlg.x_slider_group.value = 4.0
+    assert emitted == [dlg.x_slider_group.spinbox.value()]
+
+    plotter._last_update_time = -np.inf
     plotter.update()
     plotter.update_app_icon()
     plotter.close()
@@ -598,6 +714,8 @@ def test_background_plotting_toolbar(qtbot, plotting):
     assert plotter.default_camera_tool_bar is None
     assert plotter.saved_camera_positions is None
     assert plotter.saved_cameras_tool_bar is None
+    plotter.save_camera_position()
+    plotter.clear_camera_positions()
     plotter.close()
 
     plotter = BackgroundPlotter(off_screen=False)
@@ -617,6 +735,11 @@ def test_background_plotting_toolbar(qtbot, plotting):
     assert default_camera_tool_bar.isVisible()
     assert saved_cameras_tool_bar.isVisible()
 
+    # adding the toolbars again does not duplicate them
+    plotter.add_toolbars()
+    assert plotter.default_camera_tool_bar is default_camera_tool_bar
+    assert len(window.findChildren(QToolBar)) == 2
+
     # triggering a view action
     plotter._view_action.trigger()
 
@@ -696,7 +819,9 @@ def test_drop_event(tmpdir, qtbot):
         Qt.MouseButton.NoButton,
         Qt.KeyboardModifier.NoModifier,
     )
+    n_actors = len(plotter.renderer.actors)
     plotter.dropEvent(event)
+    assert len(plotter.renderer.actors) == n_actors + 1
     plotter.close()
 
 
@@ -717,7 +842,22 @@ def test_drag_event(tmpdir):
         Qt.MouseButton.NoButton,
         Qt.KeyboardModifier.NoModifier,
     )
+    event.ignore()
     plotter.dragEnterEvent(event)
+    assert event.isAccepted()
+    plotter.close()
+
+
+def test_batch_render():
+    plotter = BackgroundPlotter(update_app_icon=False)
+    rendered = []
+    plotter.render_signal.connect(lambda: rendered.append(True))
+    with plotter.batch_render():
+        with plotter.batch_render():
+            plotter.add_mesh(pyvista.Sphere())
+            plotter.render()
+        assert not rendered
+    assert rendered == [True]
     plotter.close()
 
 
@@ -778,6 +918,8 @@ def test_background_plotting_add_callback(qtbot, monkeypatch, plotting):
     assert update_count[0] in [2, 3]
     with pytest.raises(ValueError, match="ndarray with shape"):
         plotter.set_icon(0.)
+    # arrays that are not contiguous are supported too
+    plotter.set_icon(np.zeros((32, 32, 4), np.uint8)[::2, ::2])
     # Maybe someday manually setting "set_icon" should disable update_app_icon?
     # Strings also supported directly by QIcon
     plotter.set_icon(os.path.join(
@@ -876,6 +1018,12 @@ def test_background_plotting_close(qtbot, close_event, empty_scene, plotting,
     assert render_timer.isActive()
     assert not plotter._closed
 
+    # the render timer is paused while the window is minimized
+    window.signal_minimized.emit(True)
+    assert not render_timer.isActive()
+    window.signal_minimized.emit(False)
+    assert render_timer.isActive()
+
     with qtbot.wait_signals([window.signal_close], timeout=500):
         if close_event == "plotter_close":
             plotter.close()
@@ -912,6 +1060,8 @@ def test_multiplotter(qtbot, plotting):
     qtbot.addWidget(mp._window)
     mp[0, 0].add_mesh(pyvista.Cone())
     mp[0, 1].add_mesh(pyvista.Box())
+    with pytest.raises(ValueError, match='stacked'):
+        mp.set_active((0, 1))
     assert not mp._window.isVisible()
     with qtbot.wait_exposed(mp._window):
         mp.show()
@@ -923,6 +1073,22 @@ def test_multiplotter(qtbot, plotting):
     for p in mp._plotters:
         assert p._closed
 
+    # a stacked multi plotter shows one plotter at a time
+    mp = MultiPlotter(
+        nrows=1, ncols=2, show=False, off_screen=False, stacked=True
+    )
+    qtbot.addWidget(mp._window)
+    with qtbot.wait_exposed(mp._window):
+        mp.show()
+    assert mp[0, 0].app_window.isVisible()
+    assert not mp[0, 1].app_window.isVisible()
+    mp.set_active((0, 1))
+    assert not mp[0, 0].app_window.isVisible()
+    assert mp[0, 1].app_window.isVisible()
+    mp.close()
+    with pytest.raises(TypeError, match='stacked'):
+        MultiPlotter(stacked=None)
+
     # cover default show=True
     mp = MultiPlotter(off_screen=False, menu_bar=False, toolbar=False)
     qtbot.addWidget(mp._window)
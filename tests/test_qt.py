@@ -3,6 +3,7 @@ import pytest
 
 def test_no_qt_binding(no_qt):
     from pyvistaqt import BackgroundPlotter, MainWindow, MultiPlotter, QtInteractor
+    assert BackgroundPlotter.__name__ == "BackgroundPlotter"
     with pytest.raises(RuntimeError, match="No Qt binding"):
         BackgroundPlotter()
     with pytest.raises(RuntimeError, match="No Qt binding"):
@@ -11,3 +12,11 @@ def test_no_qt_binding(no_qt):
         MultiPlotter()
     with pytest.raises(RuntimeError, match="No Qt binding"):
         QtInteractor()
+
+
+def test_lazy_import():
+    import pyvistaqt
+    assert "BackgroundPlotter" in dir(pyvistaqt)
+    assert pyvistaqt.MainWindow is pyvistaqt.window.MainWindow
+    with pytest.raises(AttributeError, match="has no attribute"):
+        pyvistaqt.NotAPlotter